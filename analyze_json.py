@@ -1,20 +1,23 @@
-"""Analyze a CSV produced by the verifier_log_cronjob.sh and print the results"""
+"""Analyze JSON blobs produced by a network verifier batch-run tool and print the results"""
 import argparse
-import csv
+import json
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from models import ClusterVerifierRecord
 from util import OCMClient
 
+
 # Parse command line arguments
 arg_parser = argparse.ArgumentParser(
-    description="Analyze CSVs produced by verifier_log_cronjob.sh and print the results"
+    description="Analyze JSON blobs produced by a network verifier batch-run tool and print the results"
 )
-# argparse will call open() on csv_file automatically (no need to use "with open(...) as f")
+# argparse will call open() on json_file automatically (no need to use "with open(...) as f")
 arg_parser.add_argument(
-    "csv_file",
+    "json_file",
     type=argparse.FileType(),
-    help="path to the CSV file under analysis",
+    help="path to the JSON file under analysis",
 )
 arg_parser.add_argument(
     "--hcp",
@@ -44,10 +47,15 @@ args = arg_parser.parse_args()
 since_dt = datetime.fromisoformat(args.since).replace(tzinfo=timezone.utc)
 until_dt = datetime.fromisoformat(args.until).replace(tzinfo=timezone.utc)
 
-# Read CSV and create a ClusterVerifierRecord (CVR) from each row
+# Parse the whole JSON file in one go (C-accelerated), then create a
+# ClusterVerifierRecord (CVR) from each blob
+loaded_json = json.load(args.json_file)
+args.json_file.close()
+if isinstance(loaded_json, dict):
+    loaded_json = [loaded_json]
+
 cvrs = {}
-reader = csv.DictReader(args.csv_file)
-for row in reader:
+for row in loaded_json:
     try:
         cvr = ClusterVerifierRecord.from_dict(row)
     except KeyError as exc:
@@ -58,38 +66,53 @@ for row in reader:
     if (cvr.timestamp >= since_dt and cvr.timestamp <= until_dt) and (
         args.hcp is None or args.hcp == cvr.is_hostedcluster()
     ):
-        try:
-            cvrs[cvr.cid] += cvr
-        except KeyError:
-            # First time we're seeing a CVR for this cluster ID; store it
-            cvrs[cvr.cid] = cvr
-args.csv_file.close()
+        # Store the CVR if it's the first one seen for this cluster ID, else merge it
+        existing_cvr = cvrs.get(cvr.cid)
+        cvrs[cvr.cid] = cvr if existing_cvr is None else existing_cvr + cvr
 
 # Now for the expensive filtering: checking for internal vs. external customers
-# If we have to do this, we use a somewhat-clunky caching approach to avoid making
-# extraneous requests to OCM
+# If we have to do this, we overlap the (network-bound) OCM requests on a thread pool
+# and deduplicate org IDs so that each organization is only looked up once
 if args.internal_cx is not None:
-    filtered_cvrs = []
-    org_id_cache = {}  # Maps org IDs to bools (True == int. cx.)
     ocm_client = OCMClient()
-    cvrs_thrown_away = 0
-    # Iterate over a list-copy of the cvrs dict (so that we can delete stuff)
-    for cid, cvr in list(cvrs.items()):
+
+    def get_organization_id_or_none(cvr):
+        """Returns the organization ID owning cvr's cluster, or None if undeterminable"""
         try:
-            org_id = cvr.get_organization_id(ocm_client)
-            try:
-                cvr_is_int_cx = org_id_cache[org_id]
-            except KeyError:
-                # First time we're seeing this org_id; cache internal cx status
-                cvr_is_int_cx = is_internal_customer(ocm_client, org_id)
-                org_id_cache[org_id] = cvr_is_int_cx
-
-            # Delete CVRs whose internal status doesn't match args.internal_cx
-            if not cvr_is_int_cx == args.internal_cx:
-                del cvrs[cid]
-        except ValueError as exc:
+            return cvr.get_organization_id(ocm_client)
+        except ValueError:
+            return None
+
+    def is_internal_customer_or_none(org_id):
+        """Returns whether org_id is an internal customer, or None if undeterminable"""
+        try:
+            return is_internal_customer(ocm_client, org_id)
+        except ValueError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=ocm_client.max_connections) as executor:
+        org_ids = dict(
+            zip(cvrs, executor.map(get_organization_id_or_none, cvrs.values()))
+        )
+        unique_org_ids = list({o for o in org_ids.values() if o is not None})
+        # Maps org IDs to bools (True == int. cx.), or None if undeterminable
+        org_id_cache = dict(
+            zip(
+                unique_org_ids,
+                executor.map(is_internal_customer_or_none, unique_org_ids),
+            )
+        )
+
+    cvrs_thrown_away = 0
+    for cid, org_id in org_ids.items():
+        # Clusters whose org ID couldn't be determined have no entry in the cache
+        cvr_is_int_cx = org_id_cache.get(org_id)
+        if cvr_is_int_cx is None:
             cvrs_thrown_away += 1
             del cvrs[cid]
+        # Delete CVRs whose internal status doesn't match args.internal_cx
+        elif cvr_is_int_cx != args.internal_cx:
+            del cvrs[cid]
     if cvrs_thrown_away > 0:
         print(
             f"WARN: discarded data from {cvrs_thrown_away} clusters due to inability "
@@ -99,25 +122,24 @@ if args.internal_cx is not None:
 
 print(f"Total Clusters,{len(cvrs)},")
 
-# Create a dict of empty lists where every enumerated value of Outcome becomes a key
-outcomes = {o: [] for o in Outcome}
-
-# Sort each CVR into the dictionary created above based on outcome
-for _, cvr in cvrs.items():
-    try:
-        outcomes[cvr.get_outcome()].append(cvr)
-    except KeyError:
-        # We might hit this for NoneType outcomes
-        outcomes[cvr.get_outcome()] = [cvr]
+# Tally outcomes and FP egress endpoints in a single pass over the CVRs, computing
+# each CVR's outcome only once
+outcome_counts = Counter()
+fp_endpoints = Counter()
+for cvr in cvrs.values():
+    outcome = cvr.get_outcome()
+    outcome_counts[outcome] += 1
+    if outcome is Outcome.FALSE_POSITIVE:
+        fp_endpoints.update(cvr.egress_failures)
 
 
 # Statistical Measures
 # See https://en.wikipedia.org/wiki/Sensitivity_and_specificity
-tp = len(outcomes[Outcome.TRUE_POSITIVE])
-tn = len(outcomes[Outcome.TRUE_NEGATIVE])
-fn = len(outcomes[Outcome.FALSE_NEGATIVE])
-fp = len(outcomes[Outcome.FALSE_POSITIVE])
-errors = len(outcomes[Outcome.ERROR])
+tp = outcome_counts[Outcome.TRUE_POSITIVE]
+tn = outcome_counts[Outcome.TRUE_NEGATIVE]
+fn = outcome_counts[Outcome.FALSE_NEGATIVE]
+fp = outcome_counts[Outcome.FALSE_POSITIVE]
+errors = outcome_counts[Outcome.ERROR]
 
 print(
     f"True Negatives,{tn},\nFalse Negatives,{fn},\nTrue Positives,{tp},\n"
@@ -138,16 +160,5 @@ print(
     f"Cx. Frustration Risk,{frustration_risk:.2%},"
 )
 
-fp_endpoints = {}
-for cvr in outcomes[Outcome.FALSE_POSITIVE]:
-    for ep in cvr.get_egress_failures():
-        try:
-            fp_endpoints[ep] += 1
-        except KeyError:
-            fp_endpoints[ep] = 1
-
-fp_endpoints_str = " ".join(
-    f"{k}={v}"
-    for k, v in sorted(fp_endpoints.items(), key=lambda x: x[1], reverse=True)
-)
+fp_endpoints_str = " ".join(f"{k}={v}" for k, v in fp_endpoints.most_common())
 print(f"FP Domains,{fp_endpoints_str},")
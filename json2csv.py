@@ -2,6 +2,7 @@
 
 import models
 import json
+import sys
 import pandas as pd
 import argparse
 
@@ -31,8 +32,7 @@ else:
     print("ERR: JSON is not a dict or a list of dicts")
     sys.exit(2)
 
-list_of_cvrs = [models.ClusterVerifierRecord.from_dict(d) for d in list_of_dicts]
-
-df = models.cvrs_to_dataframe(list_of_cvrs)
+# Build the DataFrame straight from the blobs rather than via ClusterVerifierRecords
+df = models.dicts_to_dataframe(list_of_dicts)
 print(df.to_csv(index_label="idx").replace("set()", "{}"))
     
\ No newline at end of file
@@ -1,15 +1,18 @@
 """Data models for verifier log analysis"""
 
+import functools
 import json
 import re
+import sys
 from dataclasses import dataclass
 from enum import Flag, auto
 
 import requests
 import pandas as pd
+from pandas.api.types import infer_dtype
 
 import settings
-from util import csv_bool_to_bool, is_nully_str, is_valid_url
+from util import csv_bool_to_bool, is_nully_series, is_nully_str, is_valid_url
 
 
 class CPUArchitecture(Flag):
@@ -34,9 +37,50 @@ class OSDCTLVersion(Flag):
     B994063A = auto()
 
 
+@functools.lru_cache(maxsize=None)
+def parse_probe(probe_str: str) -> Probe:
+    """
+    Map a raw probe string to a Probe. Memoized, as the same handful of strings
+    repeat across every record in a batch run
+    """
+    p_string = probe_str.strip().upper()
+    if p_string == "PROBE":
+        p_string = "CURL"
+    return Probe[p_string]
+
+
+@functools.lru_cache(maxsize=None)
+def parse_arch(arch_str: str) -> CPUArchitecture:
+    """Map a raw CPU architecture string to a CPUArchitecture (memoized)"""
+    return CPUArchitecture[arch_str.strip().upper()]
+
+
+@functools.lru_cache(maxsize=None)
+def parse_osdctl_version(version_str: str) -> OSDCTLVersion:
+    """
+    Map a raw osdctl version string (e.g., "0.34.0" or a commit hash) to an
+    OSDCTLVersion. Memoized for the same reason as parse_probe()
+    """
+    v_string = "V" + version_str.strip().replace(".", "_")
+    if len(version_str.strip()) > 8:
+        v_string = version_str[:8].strip().upper()
+    return OSDCTLVersion[v_string]
+
+
 class ClusterVerifierRecord:
     """Represents a single run of the verifier recorded in a single JSON blob"""
 
+    __slots__ = (
+        "cid",
+        "duration",
+        "osdctl_version",
+        "probe",
+        "arch",
+        "output",
+        "errors",
+        "egress_failures",
+    )
+
     cid: str
     duration: float
     osdctl_version: OSDCTLVersion
@@ -50,7 +94,17 @@ class ClusterVerifierRecord:
     verifier_error_regex = re.compile(settings.VERIFIER_ERROR_REGEX_PATTERN)
     ignored_endpoints = settings.IGNORED_ENDPOINTS
 
-    def __init__(self, cid, duration, osdctl_version, probe, arch, output):
+    def __init__(
+        self,
+        cid,
+        duration,
+        osdctl_version,
+        probe,
+        arch,
+        output,
+        errors=None,
+        egress_failures=None,
+    ):
         self.cid = cid
         if is_nully_str(self.cid):
             raise ValueError("ClusterVerifierRecord required a cluster ID (cid)")
@@ -61,21 +115,26 @@ class ClusterVerifierRecord:
         self.arch = arch
 
         self.output = output
-        self.errors = set()
-        self.egress_failures = set()
-        if not is_nully_str(self.output):
-            self.errors = self.__get_errors()
-            self.egress_failures = self.__get_egress_failures()
+        has_output = not is_nully_str(self.output)
+        # Only scan the output log for whichever sets the caller hasn't provided
+        if errors is None:
+            errors = self.__get_errors() if has_output else set()
+        if egress_failures is None:
+            egress_failures = self.__get_egress_failures() if has_output else set()
+        self.errors = errors
+        self.egress_failures = egress_failures
 
     def __get_errors(self) -> set[str]:
         """Parse the output log for error messages"""
-        errors = set(re.findall(self.verifier_error_regex, self.output))
+        errors = set(self.verifier_error_regex.findall(self.output))
 
         return errors
 
     def __get_egress_failures(self) -> set[str]:
         """Parses the output log for the domains that were blocked"""
-        egress_failures = set(re.findall(self.egress_url_regex, self.output))
+        egress_failures = set(
+            map(sys.intern, self.egress_url_regex.findall(self.output))
+        )
 
         return egress_failures
 
@@ -84,7 +143,8 @@ class ClusterVerifierRecord:
         """Create an instance of this class from a dictionary produced by json.load"""
 
         _duration = float(in_dict["duration"])
-        _cid = in_dict["cid"].strip()
+        # Interned, as the same cluster ID (and endpoints) recur across many records
+        _cid = sys.intern(in_dict["cid"].strip())
         if is_nully_str(_cid):
             raise ValueError(
                 "Cannot create ClusterVerifierRecord without cluster ID (cid)"
@@ -96,17 +156,9 @@ class ClusterVerifierRecord:
                 "Cannot create ClusterVerifierRecord without an output log"
             )
 
-        p_string = in_dict["probe"].strip().upper()
-        if in_dict["probe"].strip().upper() == "PROBE":
-            p_string = "CURL"
-        _probe = Probe[p_string]
-        
-        _arch = CPUArchitecture[in_dict["arch"].strip().upper()]
-
-        v_string = "V" + in_dict["osdctl_version"].strip().replace(".", "_")
-        if len(in_dict["osdctl_version"].strip()) > 8:
-            v_string = in_dict["osdctl_version"][:8].strip().upper()
-        _osdctl_version = OSDCTLVersion[v_string]
+        _probe = parse_probe(in_dict["probe"])
+        _arch = parse_arch(in_dict["arch"])
+        _osdctl_version = parse_osdctl_version(in_dict["osdctl_version"])
 
         return cls(_cid, _duration, _osdctl_version, _probe, _arch, _output)
 
@@ -134,11 +186,16 @@ class ClusterVerifierRecord:
         _errors = self.errors ^ other.errors
         _egress_failures = self.egress_failures ^ other.egress_failures
 
-        res = ClusterVerifierRecord(_cid, _duration, _osdctl_version, _probe, _arch, "")
-        res.errors = self.errors ^ other.errors
-        res.egress_failures = self.egress_failures ^ other.egress_failures
-
-        return res
+        return ClusterVerifierRecord(
+            _cid,
+            _duration,
+            _osdctl_version,
+            _probe,
+            _arch,
+            "",
+            errors=_errors,
+            egress_failures=_egress_failures,
+        )
 
     def __eq__(self, other):
         """
@@ -156,9 +213,89 @@ class ClusterVerifierRecord:
         return f"<{self.duration:.2f}s {self.probe} run of {self.osdctl_version} on {self.arch} with {len(self.egress_failures)} egress failures and {len(self.errors)} errors>"
 
 
+# Column dtypes holding the names of each enum's members
+_ENUM_COLUMN_DTYPES = {
+    "probe": pd.CategoricalDtype([x.name for x in Probe]),
+    "arch": pd.CategoricalDtype([x.name for x in CPUArchitecture]),
+    "osdctl_version": pd.CategoricalDtype([x.name for x in OSDCTLVersion]),
+}
+
+
+def _categorize_enum_columns(df):
+    return df.astype(_ENUM_COLUMN_DTYPES)
+
+
 def cvrs_to_dataframe(cvr_list: list[ClusterVerifierRecord]):
-    df = pd.DataFrame(cvr.to_dict() for cvr in cvr_list)
-    df["probe"] = pd.Categorical(df["probe"], categories=[x.name for x in Probe])
-    df["arch"] = pd.Categorical(df["arch"], categories=[x.name for x in CPUArchitecture])
-    df["osdctl_version"] = pd.Categorical(df["osdctl_version"], categories=[x.name for x in OSDCTLVersion])
-    return df
+    # Build whole columns up front rather than having pandas infer a schema from one
+    # to_dict() per CVR
+    df = pd.DataFrame(
+        {
+            "cid": [cvr.cid for cvr in cvr_list],
+            "osdctl_version": [cvr.osdctl_version.name for cvr in cvr_list],
+            "probe": [cvr.probe.name for cvr in cvr_list],
+            "arch": [cvr.arch.name for cvr in cvr_list],
+            "duration": [cvr.duration for cvr in cvr_list],
+            "errors": [cvr.errors for cvr in cvr_list],
+            "egress_failures": [cvr.egress_failures for cvr in cvr_list],
+        }
+    )
+    return _categorize_enum_columns(df)
+
+
+# Fields of the JSON blobs that from_dict() strips/parses as strings
+_STR_FIELDS = ("cid", "output", "probe", "arch", "osdctl_version")
+
+
+def _is_well_formed(raw) -> bool:
+    """
+    Returns True if every blob in raw (a DataFrame of JSON blobs) has all the fields
+    from_dict() reads, with a string in each string field and a non-null duration
+    """
+    if any(f not in raw for f in (*_STR_FIELDS, "duration")):
+        return False
+    if raw["duration"].isna().any():
+        return False
+    return all(
+        infer_dtype(raw[f], skipna=False) == "string" and not raw[f].isna().any()
+        for f in _STR_FIELDS
+    )
+
+
+def dicts_to_dataframe(dict_list: list[dict[str, str]]):
+    """
+    Produces the same DataFrame as cvrs_to_dataframe() would for the CVRs created from
+    dict_list, but parses the JSON blobs column-wise instead of one CVR at a time
+    """
+    raw = pd.DataFrame(dict_list)
+    if not _is_well_formed(raw):
+        # Missing, null or non-string fields would otherwise surface as NaNs or
+        # misleading errors, so build CVRs one at a time to fail exactly as they do
+        return cvrs_to_dataframe([ClusterVerifierRecord.from_dict(d) for d in dict_list])
+
+    cid = raw["cid"].str.strip()
+    if is_nully_series(cid).any():
+        raise ValueError("Cannot create ClusterVerifierRecord without cluster ID (cid)")
+    output = raw["output"].str.strip()
+    if is_nully_series(output).any():
+        raise ValueError("Cannot create ClusterVerifierRecord without an output log")
+
+    # Enum columns only hold a handful of distinct strings, so parse each one once
+    def enum_names(column, parse):
+        return column.map({v: parse(v).name for v in column.unique()})
+
+    df = pd.DataFrame(
+        {
+            "cid": cid,
+            "osdctl_version": enum_names(raw["osdctl_version"], parse_osdctl_version),
+            "probe": enum_names(raw["probe"], parse_probe),
+            "arch": enum_names(raw["arch"], parse_arch),
+            "duration": raw["duration"].astype(float),
+            "errors": output.str.findall(
+                ClusterVerifierRecord.verifier_error_regex
+            ).map(set),
+            "egress_failures": output.str.findall(
+                ClusterVerifierRecord.egress_url_regex
+            ).map(set),
+        }
+    )
+    return _categorize_enum_columns(df)
@@ -1,23 +1,27 @@
 """'JSON Analysis Python Script' settings. Configure these before running'"""
 
 # Regular expression to use for capturing failed egress endpoints (should have a single
-# capturing group)
-EGRESS_URL_REGEX_PATTERN = r"egressURL error\: (?:[a-z]{3,5}:\/\/)?([\w\-\.]+\:\d+)\s"
+# capturing group). The atomic group and possessive quantifiers (Python 3.11+) stop the
+# engine from backtracking into text it has already consumed on lines that don't match.
+# The leading (?a) makes \w, \d and \s match ASCII only, which scans faster, but means
+# endpoints with non-ASCII host characters (or non-ASCII whitespace after the port) are
+# NOT captured. Remove it if your logs contain such endpoints
+EGRESS_URL_REGEX_PATTERN = r"(?a)egressURL error\: (?>[a-z]{3,5}:\/\/)?([\w\-\.]++\:\d++)\s"
 
 # Regular expression to use for capturing other runtime errors (should have a single
 # capturing group)
 VERIFIER_ERROR_REGEX_PATTERN = (
     r"network verifier error:\s*(exceeded max wait time for \w* waiter"
-    r"|missing required permission [\w\d]*:[\w\d]*"
+    r"|missing required permission \w*:\w*"
     r"|waiter state transitioned to Failure"
     r"|timed out waiting for the condition"
-    r"|unable to cleanup [\w\s]*"
-    r"|error performing [\w\d]*:[\w\d]*).*[\n$]"
+    r"|unable to cleanup [\w \t]*"
+    r"|error performing \w*:\w*).*"
 )
 
 # Set of egress endpoints that should be ignored entirely. This might be useful if the
 # endpoint was flaky/unreliable during data collection
-IGNORED_ENDPOINTS = set(
+IGNORED_ENDPOINTS = frozenset(
     [
         "example.com"
     ]
@@ -2,9 +2,38 @@
 import json
 import os
 import re
+import threading
 
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
 from oauthlib.oauth2 import TokenExpiredError
+from urllib3.util.retry import Retry
+
+# Compiled once at import rather than on every is_valid_url() call
+_URL_REGEX = re.compile(
+    r"^https?://"  # http:// or https://
+    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain...
+    r"localhost|"  # localhost...
+    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
+    r"(?::\d+)?"  # optional port
+    r"(?:/?|[/?]\S+)$",
+    # ASCII-only classes: also stops IGNORECASE folding e.g. "\u212a" (Kelvin) into "K"
+    re.IGNORECASE | re.ASCII,
+)
+
+# Stripped, lowercased values that is_nully_str() treats as null
+_NULLY_STRS = frozenset(["", "null"])
+
+# Lookup table for csv_bool_to_bool() covering the spellings spreadsheets actually emit
+_CSV_BOOLS = {
+    "true": True,
+    "True": True,
+    "TRUE": True,
+    "false": False,
+    "False": False,
+    "FALSE": False,
+}
+
 
 class OCMClient:
     """
@@ -12,6 +41,20 @@ class OCMClient:
     variable OCM_CONFIG
     """
 
+    # Size of the keep-alive connection pool to the OCM host, i.e., how many requests can
+    # be in flight concurrently (e.g., from a thread pool) without opening throwaway
+    # connections
+    max_connections = 32
+
+    __slots__ = (
+        "_token",
+        "_refresh_lock",
+        "_client_id",
+        "_refresh_url",
+        "_base_url",
+        "_session",
+    )
+
     def __init__(self):
         with open(os.getenv("OCM_CONFIG"), encoding="utf-8") as ocm_config_file:
             ocm_config = json.load(ocm_config_file)
@@ -22,6 +65,7 @@ class OCMClient:
             "token_type": "Bearer",
             "expires_at": 10,
         }
+        self._refresh_lock = threading.Lock()
         self._client_id = ocm_config["client_id"]
         self._refresh_url = ocm_config["token_url"]
         self._base_url = ocm_config["url"]
@@ -31,52 +75,77 @@ class OCMClient:
             client_id=self._client_id,
             token=self._token,
         )
-
-    def _refresh_token(self):
-        """Requests a new Bearer token and updates self._token"""
-        self._token = self._session.refresh_token(
-            token_url=self._refresh_url, client_id=self._client_id
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_maxsize=self.max_connections,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    raise_on_status=False,
+                ),
+            ),
         )
-        self._session = OAuth2Session(client_id=self._client_id, token=self._token)
+
+    def _refresh_token(self, expired_token=None):
+        """
+        Requests a new Bearer token and updates self._token. The existing session is
+        kept (rather than rebuilt) so that its pooled keep-alive connections survive.
+        Safe to call from several threads: if expired_token is given but has already
+        been replaced by another thread, no new token is requested
+        """
+        with self._refresh_lock:
+            if expired_token is not None and self._token is not expired_token:
+                return
+            self._token = self._session.refresh_token(
+                token_url=self._refresh_url, client_id=self._client_id
+            )
+            self._session.token = self._token
 
     def get(self, path, **kwargs):
         """Wrapper around requests module's get()"""
+        url = self._base_url + path
+        token = self._token
         try:
-            return self._session.get(self._base_url + path, **kwargs)
+            return self._session.get(url, **kwargs)
         except TokenExpiredError:
-            # Refresh token and try again
-            self._refresh_token()
-            return self._session.get(self._base_url + path, **kwargs)
+            # Refresh token (unless another thread already has) and try again
+            self._refresh_token(token)
+            return self._session.get(url, **kwargs)
 
 
 def csv_bool_to_bool(csv_bool_str):
     """Converts an Excel/CSV-style Boolean string (TRUE/FALSE) into a Python bool"""
-    if csv_bool_str.strip().lower() == "true":
-        return True
-    if csv_bool_str.strip().lower() == "false":
-        return False
-    return None
+    result = _CSV_BOOLS.get(csv_bool_str)
+    if result is None:
+        # Slow path for unusual casing or surrounding whitespace
+        result = _CSV_BOOLS.get(csv_bool_str.strip().lower())
+    return result
 
 
 def is_nully_str(s):
     """
     Returns True if s is None, an empty or whitespace-filled string, or some variation of "NULL"
     """
-    if s is None:
+    # Covers both None and the empty string without any string operations
+    if not s:
         return True
-    s_strip = s.lower().strip()
-    return s_strip in ["", "null"]
+    # Anything longer than "null" without surrounding whitespace can't be nully, so
+    # skip allocating stripped/lowercased copies for the common (non-null) case
+    if len(s) > 4 and not s[0].isspace() and not s[-1].isspace():
+        return False
+    return s.strip().lower() in _NULLY_STRS
+
+
+def is_nully_series(series):
+    """Vectorized is_nully_str() over a pandas Series, returning a boolean Series"""
+    return series.isna() | series.fillna("").str.strip().str.lower().isin(_NULLY_STRS)
 
 
 def is_valid_url(url):
     """Returns true if input is a valid HTTP(S) URL"""
-    regex = re.compile(
-        r"^https?://"  # http:// or https://
-        r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain...
-        r"localhost|"  # localhost...
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
-        r"(?::\d+)?"  # optional port
-        r"(?:/?|[/?]\S+)$",
-        re.IGNORECASE,
-    )
-    return bool(url is not None and regex.search(url))
+    if not url:
+        return False
+    # match() rather than search(): the pattern is anchored, so only try position 0
+    return _URL_REGEX.match(url) is not None